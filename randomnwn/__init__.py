@@ -23,6 +23,9 @@ from .nanowires import (
 
 from .line_functions import (
     create_line,
+    create_lines_bulk,
+    get_endpoints,
+    segment_intersects,
     find_intersects,
     find_line_intersects,
     add_points_to_line,
@@ -9,7 +9,6 @@
 import numpy as np
 import scipy
 import networkx as nx
-from networkx.linalg import laplacian_matrix
 from typing import List, Tuple, Set, Union
 
 from .nanowires import get_edge_indices
@@ -75,41 +74,90 @@ def create_matrix(
     if drain_nodes is None:
         drain_nodes = []
 
-    # Get Laplacian matrix
-    nodelist = NWN.graph["node_indices"].keys()
-    nodelist_len = len(nodelist)
-    M = laplacian_matrix(NWN, nodelist=nodelist, weight=value_type)
+    # Get edge list as node indices and weights
+    node_indices = NWN.graph["node_indices"]
+    nodelist_len = len(node_indices)
+    u, v, weight = _get_edge_arrays(NWN, value_type)
 
     # Ground every node with a huge resistor/tiny capacitor
+    diag = np.zeros(nodelist_len)
     if ground_nodes:
         # Get list of node indices which are not connected to an electrode
         unconnected_indices = list(
-            set(NWN.graph["node_indices"].values()).difference(
-                set(NWN.graph["node_indices"][node] for node in 
+            set(node_indices.values()).difference(
+                set(node_indices[node] for node in 
                     get_connected_nodes(NWN, [*source_nodes, *drain_nodes])
                 )
             )
         )
 
-        small = np.zeros(nodelist_len)
-        small[unconnected_indices] = 1e-12
-
         # Add small value to diagonal, grounding all non-connected nodes
-        M += scipy.sparse.dia_matrix(
-            (small, [0]), 
-            shape = (nodelist_len, nodelist_len)
-        )
+        diag[unconnected_indices] = 1e-12
+
+    # Drain nodes' rows and columns are zeroed
+    is_drain = np.zeros(nodelist_len, dtype=bool)
+    is_drain[[node_indices[drain] for drain in drain_nodes]] = True
+
+    # Build the Laplacian matrix in COO format
+    rows, cols, data = _laplacian_coo(u, v, weight, diag, is_drain)
+
+    M = scipy.sparse.coo_matrix(
+        (data, (rows, cols)), shape=(nodelist_len, nodelist_len)
+    ).tocsr()
+    M.eliminate_zeros()
+    return M
+
 
-    # Zero each of the drain nodes' row and column
-    for drain in drain_nodes:
-        # Change to lil since csr sparsity changes are expensive
-        M = M.tolil()
-        drain_index = NWN.graph["node_indices"][drain]
-        M[drain_index] = 0
-        M[:, drain_index] = 0
-        M[drain_index, drain_index] = 1
+def _get_edge_arrays(
+    NWN: nx.Graph, 
+    value_type: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the node indices of both ends of each edge and the given
+    attribute of each edge, in the order of `NWN.edges`. Missing attributes
+    default to one.
 
-    return M.tocsr()
+    """
+    node_indices = NWN.graph["node_indices"]
+    edges = np.fromiter(
+        (
+            (node_indices[u], node_indices[v], weight) 
+            for u, v, weight in NWN.edges(data=value_type, default=1)
+        ),
+        dtype = [("u", np.intp), ("v", np.intp), ("weight", float)],
+        count = NWN.number_of_edges()
+    )
+    return edges["u"], edges["v"], edges["weight"]
+
+
+def _laplacian_coo(
+    u: np.ndarray, 
+    v: np.ndarray, 
+    weight: np.ndarray, 
+    diag: np.ndarray, 
+    is_drain: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the rows, columns, and values of the Laplacian matrix in COO 
+    format. `diag` is added to the diagonal and the rows and columns of the
+    drain nodes are zero except for a one on the diagonal.
+
+    """
+    nodelist_len = len(diag)
+
+    # Diagonal of the Laplacian matrix is the total weight of each node
+    diag = (diag + np.bincount(u, weight, nodelist_len) + 
+        np.bincount(v, weight, nodelist_len))
+    diag[is_drain] = 1
+
+    off_diag = np.where(is_drain[u] | is_drain[v], 0.0, -weight)
+
+    indices = np.arange(nodelist_len)
+    rows = np.concatenate((u, v, indices))
+    cols = np.concatenate((v, u, indices))
+    data = np.concatenate((off_diag, off_diag, diag))
+
+    return rows, cols, data
 
 
 def _solver(A, z, solver, **kwargs):
@@ -120,11 +168,11 @@ def _solver(A, z, solver, **kwargs):
     if solver == "spsolve":
         x = scipy.sparse.linalg.spsolve(A.tocsr(), z, **kwargs)
     elif solver == "minres":
-        x, exit_code = scipy.sparse.linalg.minres(A, z.toarray(), **kwargs)
+        x, exit_code = scipy.sparse.linalg.minres(A, z, **kwargs)
     elif solver == "lgmres":
-        x, exit_code = scipy.sparse.linalg.lgmres(A, z.toarray(), **kwargs)
+        x, exit_code = scipy.sparse.linalg.lgmres(A, z, **kwargs)
     elif solver == "gcrotmk":
-        x, exit_code = scipy.sparse.linalg.gcrotmk(A, z.toarray(), **kwargs)
+        x, exit_code = scipy.sparse.linalg.gcrotmk(A, z, **kwargs)
     else:
         raise ValueError("Not implemented solver.")
     
@@ -150,15 +198,31 @@ def _solve_voltage(
     # Ground nodes only if needed
     ground_nodes = True if solver == "spsolve" else False
 
+    # With a direct solver, the source voltages can be fixed by replacing
+    # the source rows instead of adding a row and column for each source.
+    if solver == "spsolve":
+        M = create_matrix(NWN, "conductance", source_nodes, drain_nodes, ground_nodes)
+        is_source = np.zeros(len(nodelist))
+        is_source[source_indices] = 1
+        A = scipy.sparse.diags(1 - is_source) @ M + scipy.sparse.diags(is_source)
+        z = is_source * voltage
+
+        V = _solver(A, z, solver, **kwargs)
+
+        # Current supplied by each source
+        I = (M @ V)[source_indices]
+        return np.concatenate((V, I))
+
     G = -create_matrix(NWN, "conductance", source_nodes, drain_nodes, ground_nodes)
-    B = scipy.sparse.dok_matrix((len(nodelist), len(source_indices)))
-    for i, ind in enumerate(source_indices):
-        B[ind, i] = 1
+    B = scipy.sparse.coo_matrix(
+        (np.ones(len(source_indices)), (source_indices, range(len(source_indices)))),
+        shape = (len(nodelist), len(source_indices))
+    )
     C = B.T
     D = None
 
     A = scipy.sparse.bmat([[G, B], [C, D]])
-    z = scipy.sparse.dok_matrix((len(nodelist) + len(source_indices), 1))
+    z = np.zeros(len(nodelist) + len(source_indices))
     z[len(nodelist):] = voltage
 
     out = _solver(A, z, solver, **kwargs)
@@ -184,7 +248,7 @@ def _solve_current(
     ground_nodes = True if solver == "spsolve" else False
 
     G = create_matrix(NWN, "conductance", source_nodes, drain_nodes, ground_nodes)
-    z = scipy.sparse.dok_matrix((len(nodelist), 1))
+    z = np.zeros(len(nodelist))
     z[source_indices] = current
 
     out = _solver(G, z, solver, **kwargs)
@@ -298,22 +362,19 @@ def solve_drain_current(
     if isinstance(drain_node, tuple):
         drain_node = [drain_node]
 
-    # Preallocate output
-    current_array = np.zeros(len(drain_node))
-
     # Solve nodes
     out = solve_network(
         NWN, source_node, drain_node, voltage, "voltage", solver, **kwargs
     )
 
+    # Current flowing along each edge into both of its nodes
+    u, v, G = _get_edge_arrays(NWN, "conductance")
+    nodelist_len = len(NWN.graph["node_indices"])
+    inflow = (np.bincount(v, out[u] * G, nodelist_len) + 
+        np.bincount(u, out[v] * G, nodelist_len))
+
     # Find current through each drain node
-    for i, drain in enumerate(drain_node):
-        I = 0
-        for node in NWN.neighbors(drain):
-            V = out[NWN.graph["node_indices"][node]]
-            R = 1 / NWN.edges[(node, drain)]["conductance"]
-            I += V / R
-        current_array[i] = I
+    current_array = inflow[[NWN.graph["node_indices"][drain] for drain in drain_node]]
 
     # Scale the output if desired
     if scaled:
@@ -368,22 +429,16 @@ def solve_nodal_current(
         NWN, source_node, drain_node, voltage, "voltage", solver, **kwargs
     )
     
-    # Preallocate output
-    current_array = np.zeros(len(NWN.nodes))
-
-    # Calculate input current for each node
-    for node in NWN.nodes:
-        node_ind = NWN.graph["node_indices"][node]
-        for edge in NWN.edges(node):
-            edge0_ind = NWN.graph["node_indices"][edge[0]]
-            edge1_ind = NWN.graph["node_indices"][edge[1]]
-            V_delta = V_out[edge1_ind] - V_out[edge0_ind]
-
-            # Only add current entering a node so we can see how much
-            # current passes through. Else, we just get zero due to KCL.
-            if V_delta > 0:
-                current_array[node_ind] += (V_delta * 
-                    NWN.edges[edge]["conductance"] * np.sign(voltage))
+    # Get the current along each edge from u to v
+    u, v, G = _get_edge_arrays(NWN, "conductance")
+    I = (V_out[u] - V_out[v]) * G
+
+    # Only add current entering a node so we can see how much
+    # current passes through. Else, we just get zero due to KCL.
+    nodelist_len = len(NWN.graph["node_indices"])
+    current_array = (np.bincount(v, np.where(I > 0, I, 0), nodelist_len) + 
+        np.bincount(u, np.where(I < 0, -I, 0), nodelist_len))
+    current_array *= np.sign(voltage)
 
     # Scale the output if desired
     if scaled:
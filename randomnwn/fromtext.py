@@ -12,7 +12,8 @@ import numpy as np
 from shapely.geometry import LineString
 import networkx as nx
 
-from .line_functions import find_intersects
+from .line_functions import _find_intersects_endpoints
+from .nanowires import _set_geometry_arrays
 from .units import get_units
 
 def create_NWN_from_txt(
@@ -100,14 +101,17 @@ def create_NWN_from_txt(
     # Add the wires as nodes to the graph
     for i in range(NWN.graph["wire_num"]):
         NWN.graph["lines"].append(line_list[i])
+        NWN.add_node((i,))
         if i == 0 or i == 1:
-            NWN.add_node((i,), electrode=True)
             NWN.graph["electrode_list"].append((i,))
-        else:
-            NWN.add_node((i,), electrode=False)
+
+    # Keep track of which wires are electrodes
+    NWN.graph["electrode"] = np.zeros(wire_num, dtype=bool)
+    NWN.graph["electrode"][:2] = True
         
     # Find intersects and create the edges (junctions)
-    intersect_dict = find_intersects(NWN.graph["lines"])
+    endpoints = np.column_stack((x[0::2], y[0::2], x[1::2], y[1::2]))
+    intersect_dict = _find_intersects_endpoints(endpoints, NWN.graph["lines"])
     NWN.add_edges_from(
         [((key[0],), (key[1],)) for key in intersect_dict.keys()], 
         conductance = conductance,
@@ -115,7 +119,9 @@ def create_NWN_from_txt(
         w = 0.0,
         type = "junction"
     )
-    NWN.graph["loc"] = intersect_dict
+
+    # Store the wire geometry and intersection locations
+    _set_geometry_arrays(NWN, endpoints, intersect_dict)
     
     # Find junction density
     NWN.graph["junction_density"] = len(intersect_dict) / size
@@ -9,7 +9,17 @@
 from typing import List, Dict, Tuple
 import numpy as np
 from numpy.random import uniform
+import shapely
 from shapely.geometry import LineString, Point
+from shapely.strtree import STRtree
+
+# Above this many lines, candidate pairs are found with an STRtree instead
+# of checking every pair. Below it both take about the same time.
+_STRTREE_MIN_LINES = 256
+
+# Number of lines per block when checking all pairs with NumPy. Chosen so
+# the temporary arrays of each block stay in cache.
+_BLOCK_SIZE = 256
 
 
 def create_line(length=1, xmin=0, xmax=1, ymin=0, ymax=1, rng=None) -> LineString:
@@ -59,6 +69,194 @@ def create_line(length=1, xmin=0, xmax=1, ymin=0, ymax=1, rng=None) -> LineStrin
     return out
 
 
+def create_lines_bulk(
+    num: int, length=1, xmin=0, xmax=1, ymin=0, ymax=1, rng=None
+) -> np.ndarray:
+    """
+    Generate ``num`` random lines at once. Equivalent to calling 
+    ``create_line`` ``num`` times with the same generator, but returns the 
+    endpoints of the lines instead of LineStrings.
+
+    Parameters
+    ----------
+    num : int
+        Number of lines to generate.
+
+    length : float or ndarray
+        Length of the lines. An array gives the length of each line.
+
+    xmin, xmax, ymin, ymax : float
+        Bounds of the midpoints of the lines.
+
+    rng : Generator
+        Generator object usually created from ``default_rng`` from 
+        ``numpy.random``. If None, uses the default NumPy random functions.
+
+    Returns
+    -------
+    out : ndarray
+        (num, 4) array of the endpoints of the lines as (x1, y1, x2, y2).
+
+    """
+    if rng is not None:
+        p = rng.uniform(0, 1, (num, 3))
+    else:
+        p = uniform(0, 1, (num, 3))
+
+    xmid = xmin + (xmax - xmin) * p[:, 0]
+    ymid = ymin + (ymax - ymin) * p[:, 1]
+    angle = np.pi * p[:, 2]
+
+    half = np.asarray(length) / 2
+    xhalf, yhalf = half * np.cos(angle), half * np.sin(angle)
+
+    out = np.column_stack((xmid - xhalf, ymid - yhalf, xmid + xhalf, ymid + yhalf))
+    return out
+
+
+def get_endpoints(lines: List[LineString]) -> np.ndarray:
+    """
+    Given a list of LineStrings, returns an (N, 4) array of the start and end 
+    coordinates of each line as the columns (x1, y1, x2, y2).
+
+    """
+    lines = np.asarray(lines, dtype=object)
+    start = shapely.get_coordinates(shapely.get_point(lines, 0))
+    end = shapely.get_coordinates(shapely.get_point(lines, -1))
+    return np.hstack((start, end)).reshape(-1, 4)
+
+
+def segment_intersects(
+    endpoints: np.ndarray, 
+    idx_a: np.ndarray, 
+    idx_b: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Analytically find which pairs of line segments intersect and where.
+
+    Parameters
+    ----------
+    endpoints : ndarray
+        (N, 4) array of the line segments' endpoints as (x1, y1, x2, y2).
+
+    idx_a, idx_b : ndarray
+        Indices of the pairs of segments to check.
+
+    Returns
+    -------
+    mask : ndarray
+        Boolean array of which pairs intersect.
+
+    points : ndarray
+        (M, 2) array of the intersection locations of the intersecting pairs.
+
+    """
+    mask, t = _segment_params(endpoints[idx_a], endpoints[idx_b])
+    points = _segment_points(endpoints[idx_a][mask], t[mask])
+
+    return mask, points
+
+
+def _segment_params(p: np.ndarray, q: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Given two broadcastable arrays of segments with (x1, y1, x2, y2) as the 
+    last axis, returns which pairs intersect and the position ``t`` of the
+    intersection along the segments in ``p``.
+
+    """
+    x1, y1, x2, y2 = np.moveaxis(p, -1, 0)
+    x3, y3, x4, y4 = np.moveaxis(q, -1, 0)
+
+    # Cross products of the segment directions and their offsets
+    d = (x2 - x1) * (y4 - y3) - (y2 - y1) * (x4 - x3)
+    t_num = (x3 - x1) * (y4 - y3) - (y3 - y1) * (x4 - x3)
+    u_num = (x3 - x1) * (y2 - y1) - (y3 - y1) * (x2 - x1)
+
+    # Parallel segments are treated as non-intersecting
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = t_num / d
+        u = u_num / d
+    mask = (d != 0) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+
+    return mask, t
+
+
+def _segment_points(p: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Returns the (M, 2) locations at positions ``t`` along the segments ``p``.
+
+    """
+    x1, y1, x2, y2 = p.T
+    return np.column_stack((x1 + t * (x2 - x1), y1 + t * (y2 - y1)))
+
+
+def _get_bounds(endpoints: np.ndarray) -> np.ndarray:
+    """
+    Returns the (N, 4) axis-aligned bounding boxes of the line segments as 
+    (xmin, ymin, xmax, ymax).
+
+    """
+    x, y = endpoints[:, 0::2], endpoints[:, 1::2]
+    return np.column_stack((x.min(axis=1), y.min(axis=1), x.max(axis=1), y.max(axis=1)))
+
+
+def _boxes_overlap(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    Given two broadcastable arrays of bounding boxes with 
+    (xmin, ymin, xmax, ymax) as the last axis, returns which pairs overlap.
+
+    """
+    return (
+        (p[..., 0] <= q[..., 2]) & (p[..., 2] >= q[..., 0]) &
+        (p[..., 1] <= q[..., 3]) & (p[..., 3] >= q[..., 1])
+    )
+
+
+def _find_intersects_tiled(
+    endpoints: np.ndarray, 
+    block: int = _BLOCK_SIZE
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Checks every pair of lines for an intersection, one block of lines 
+    against another at a time. Returns the indices of the intersecting pairs, 
+    ordered by index, and the intersection locations.
+
+    Only pairs whose bounding boxes overlap are checked for an intersection.
+    The boxes are compared in single precision, rounded outwards so no 
+    overlapping pair is missed.
+
+    """
+    n = len(endpoints)
+    hits_a, hits_b = [np.empty(0, dtype=np.intp)], [np.empty(0, dtype=np.intp)]
+
+    bounds = _get_bounds(endpoints).astype(np.float32)
+    bounds[:, :2] = np.nextafter(bounds[:, :2], np.float32(-np.inf))
+    bounds[:, 2:] = np.nextafter(bounds[:, 2:], np.float32(np.inf))
+
+    for bi in range(0, n, block):
+        p = bounds[bi:bi + block]
+        for bj in range(bi, n, block):
+            q = bounds[bj:bj + block]
+            near = _boxes_overlap(p[:, None, :], q[None, :, :])
+
+            # Only keep each pair once
+            if bi == bj:
+                near = np.triu(near, k=1)
+
+            ia, ib = np.nonzero(near)
+            hits_a.append(ia + bi)
+            hits_b.append(ib + bj)
+
+    idx_a = np.concatenate(hits_a)
+    idx_b = np.concatenate(hits_b)
+    order = np.lexsort((idx_b, idx_a))
+    idx_a, idx_b = idx_a[order], idx_b[order]
+
+    # Exact check of the candidates in double precision
+    mask, points = segment_intersects(endpoints, idx_a, idx_b)
+    return idx_a[mask], idx_b[mask], points
+
+
 def find_intersects(lines: list) -> Dict[Tuple[int, int], Point]:
     """
     Given a list of LineStrings, finds all the lines that intersect and where.
@@ -68,9 +266,6 @@ def find_intersects(lines: list) -> Dict[Tuple[int, int], Point]:
     lines : list of LineStrings
         List of the LineStrings to find the intersections of.
 
-    loc : bool
-        Whether or not to return the intersect locations. Defaults to false.
-
     Returns
     -------
     out : dict
@@ -78,35 +273,80 @@ def find_intersects(lines: list) -> Dict[Tuple[int, int], Point]:
         and the value is the intersection locations.
 
     """
-    out = {}
+    lines = np.asarray(lines, dtype=object)
+    return _find_intersects_endpoints(get_endpoints(lines), lines)
+
+
+def _find_intersects_endpoints(
+    endpoints: np.ndarray, 
+    lines: np.ndarray = None
+) -> Dict[Tuple[int, int], Point]:
+    """
+    Same as ``find_intersects``, but takes the (N, 4) endpoints of the lines.
+    The LineStrings are only needed for the STRtree and are created from the
+    endpoints if not given.
 
-    for i, j in zip(*np.triu_indices(n=len(lines), k=1)):
-        # Check for intersection first before calculating it
-        if lines[i].intersects(lines[j]):
-            out.update({(i, j): lines[i].intersection(lines[j])})
+    """
+    if len(endpoints) < _STRTREE_MIN_LINES:
+        # Check all pairs
+        idx_a, idx_b, points = _find_intersects_tiled(endpoints)
+
+    else:
+        # Only check pairs whose bounding boxes overlap
+        if lines is None:
+            lines = shapely.linestrings(endpoints.reshape(-1, 2, 2))
+        tree = STRtree(lines)
+        idx_a, idx_b = tree.query(lines)
+
+        # Keep each pair once, ordered by index
+        keep = idx_a < idx_b
+        idx_a, idx_b = idx_a[keep], idx_b[keep]
+        order = np.lexsort((idx_b, idx_a))
+        idx_a, idx_b = idx_a[order], idx_b[order]
+
+        mask, points = segment_intersects(endpoints, idx_a, idx_b)
+        idx_a, idx_b = idx_a[mask], idx_b[mask]
+
+    out = dict(zip(
+        zip(idx_a.tolist(), idx_b.tolist()), shapely.points(points)
+    ))
 
     return out
 
 
-def find_line_intersects(ind: int, lines: List[LineString]) -> Dict[Tuple[int, int], Point]:
+def find_line_intersects(
+    ind: int, 
+    lines: List[LineString], 
+    tree: STRtree = None
+) -> Dict[Tuple[int, int], Point]:
     """
     Given a list of LineStrings, find all the lines that intersect
     with a specified line in the list given by the index ``ind``.
 
+    An STRtree of the first lines in the list can be passed to avoid 
+    rebuilding one. Lines after those in the tree are always checked.
+
     """
-    out = {}
+    if tree is None:
+        tree = STRtree(lines)
+
+    # Only check lines whose bounding boxes overlap with the given line
+    hits = np.concatenate((
+        tree.query(lines[ind]), np.arange(len(tree.geometries), len(lines))
+    ))
 
-    for j in range(len(lines)):
-        # Skip intersection with the line itself
-        if ind == j:
-            continue
-        
-        # Checking if these's an intersection first is faster
-        if lines[ind].intersects(lines[j]):
-            if ind < j:
-                out.update({(ind, j): lines[ind].intersection(lines[j])})
-            else:
-                out.update({(j, ind): lines[ind].intersection(lines[j])})
+    # Skip intersection with the line itself
+    hits = np.sort(hits[hits != ind])
+
+    endpoints = get_endpoints([lines[ind], *(lines[j] for j in hits)])
+    mask, points = segment_intersects(
+        endpoints, np.zeros_like(hits), np.arange(1, len(hits) + 1)
+    )
+    # Keys are always ordered as (smaller index, larger index)
+    out = {
+        (min(ind, j), max(ind, j)): point 
+        for j, point in zip(hits[mask].tolist(), shapely.points(points))
+    }
 
     return out
 
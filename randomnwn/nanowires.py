@@ -9,11 +9,14 @@
 from typing import List, Tuple, Union, Iterable, Dict
 from numbers import Number
 import numpy as np
-from shapely.geometry import LineString
+import shapely
+from shapely.geometry import LineString, Point
+from shapely.strtree import STRtree
 import networkx as nx
 
 from .line_functions import (
-    create_line, find_intersects, find_line_intersects, add_points_to_line
+    create_lines_bulk, get_endpoints, find_line_intersects, add_points_to_line,
+    _find_intersects_endpoints
 )
 from .units import get_units
 
@@ -130,19 +133,24 @@ def create_NWN(
 
     wire_lengths = rng.normal(wire_length_mean, wire_length_sd, wire_num)
 
+    # Generate the wires all at once
+    endpoints = create_lines_bulk(
+        wire_num, 
+        wire_lengths, 
+        xmax = NWN.graph["length"], 
+        ymax = NWN.graph["width"], 
+        rng = rng
+    )
+
     # Add the wires as nodes to the graph
-    for i in range(NWN.graph["wire_num"]):
-        NWN.graph["lines"].append(create_line(
-            # NWN.graph["wire_length"], 
-            wire_lengths[i], 
-            xmax = NWN.graph["length"], 
-            ymax = NWN.graph["width"], 
-            rng = rng
-        ))
-        NWN.add_node((i,), electrode=False)
+    NWN.graph["lines"] = list(shapely.linestrings(endpoints.reshape(-1, 2, 2)))
+    NWN.add_nodes_from((i,) for i in range(wire_num))
+
+    # Keep track of which wires are electrodes
+    NWN.graph["electrode"] = np.zeros(wire_num, dtype=bool)
         
     # Find intersects and create the edges (junctions)
-    intersect_dict = find_intersects(NWN.graph["lines"])
+    intersect_dict = _find_intersects_endpoints(endpoints, NWN.graph["lines"])
     NWN.add_edges_from(
         [((key[0],), (key[1],)) for key in intersect_dict.keys()], 
         conductance = conductance,
@@ -152,7 +160,9 @@ def create_NWN(
         epsilon = 0.0,
         type = "junction"
     )
-    NWN.graph["loc"] = intersect_dict
+
+    # Store the wire geometry and intersection locations
+    _set_geometry_arrays(NWN, endpoints, intersect_dict)
     
     # Find junction density
     NWN.graph["junction_density"] = len(intersect_dict) / size
@@ -165,17 +175,58 @@ def create_NWN(
     return NWN
 
 
+def _set_geometry_arrays(
+    NWN: nx.Graph, 
+    endpoints: np.ndarray, 
+    intersect_dict: Dict[Tuple[int, int], Point]
+):
+    """
+    Adds the endpoints and midpoints of new wires and the locations of new
+    intersections to the graph. The arrays are created if the graph does not
+    have them yet.
+
+    """
+    midpoints = 0.5 * (endpoints[:, :2] + endpoints[:, 2:])
+    loc_xy = shapely.get_coordinates(list(intersect_dict.values()))
+
+    if "endpoints" in NWN.graph:
+        endpoints = np.vstack((NWN.graph["endpoints"], endpoints))
+        midpoints = np.vstack((NWN.graph["midpoints"], midpoints))
+        loc_xy = np.vstack((NWN.graph["loc_xy"], loc_xy))
+
+    NWN.graph["endpoints"] = endpoints
+    NWN.graph["midpoints"] = midpoints
+    NWN.graph["loc_xy"] = loc_xy
+
+    # Intersection locations, and their rows in loc_xy, by the pair of wires
+    loc = NWN.graph.setdefault("loc", {})
+    loc_idx = NWN.graph.setdefault("loc_idx", {})
+    loc_idx.update({key: len(loc_idx) + k for k, key in enumerate(intersect_dict)})
+    loc.update(intersect_dict)
+
+
 def create_line_sections(NWN: nx.Graph):
+    # Group the intersections by wire
+    wire_intersects = [[] for _ in range(NWN.graph["wire_num"])]
+    for (a, b), k in NWN.graph['loc_idx'].items():
+        wire_intersects[a].append((b, k))
+        wire_intersects[b].append((a, k))
+
     # Create Line Section
     section_dict = {}
+    section_coords = []
     for i in range(NWN.graph["wire_num"]):
-        o1, o2 = NWN.graph['lines'][i].coords
-        o1 = np.array(o1)
-        o2 = np.array(o2)
-        interesct_points = {np.linalg.norm(np.array(p.coords[0]) - o1): com[0] if com[1] == i else com[1] for com, p in NWN.graph['loc'].items() if i in com}
-        
-        section_dict[i] = [interesct_points[d] for d in sorted(interesct_points.keys())]
+        pairs = np.array(wire_intersects[i], dtype=int).reshape(-1, 2)
+        others, points = pairs[:, 0], NWN.graph['loc_xy'][pairs[:, 1]]
+
+        # Order the intersections by the distance from the start of the wire
+        o1 = NWN.graph['endpoints'][i, :2]
+        order = np.argsort(np.linalg.norm(points - o1, axis=1), kind="stable")
+
+        section_dict[i] = others[order].tolist()
+        section_coords.append(points[order])
     NWN.graph['section_point'] = section_dict
+    NWN.graph['section_coords'] = section_coords
     
     return NWN
     
@@ -212,7 +263,8 @@ def convert_NWN_to_MNR(NWN: nx.Graph):
 
         # Get location of the junction for a wire
         junction_locs = {
-            edge: NWN.graph["loc"][tuple(sorted([edge[0][0], edge[1][0]]))] for edge in junctions
+            edge: NWN.graph["loc"][(min(i, edge[1][0]), max(i, edge[1][0]))] 
+            for edge in junctions
         }
 
         # Add junctions as part of the LineString that makes up the wire
@@ -233,7 +285,7 @@ def convert_NWN_to_MNR(NWN: nx.Graph):
             old_attributes = NWN.edges[edge]
 
             # Create the replacing MNR node and edge
-            NWN.add_node((i, j), loc=loc, electrode=False)
+            NWN.add_node((i, j), loc=loc)
             NWN.add_edge((i, j), other_node, **old_attributes)
 
         # Remove old JDA node
@@ -307,40 +359,56 @@ def add_wires(
     NWN.graph["wire_num"] += new_wire_num
 
     # Keep track of new wires
-    new_wire_nodes = []
+    new_wire_nodes = [(start_ind + i,) for i in range(new_wire_num)]
+
+    # Keep track of which new wires are electrodes
+    NWN.graph["electrode"] = np.concatenate((
+        NWN.graph["electrode"], np.asarray(electrodes, dtype=bool)
+    ))
 
-    # Add wires to NWN
+    # Spatial index of the existing wires. STRtrees cannot be added to, so 
+    # newer wires are checked directly until the tree is rebuilt.
+    tree = NWN.graph.get("_strtree")
+    if tree is None or len(tree.geometries) > start_ind:
+        tree = STRtree(NWN.graph["lines"])
+
+    # Find the intersects of each new wire with all of the wires before it
+    intersect_dict = {}
     for i in range(new_wire_num):
-        # Create new node
         NWN.graph["lines"].append(lines[i])
-        new_wire_nodes.append((start_ind + i,))
-        NWN.add_node(
-            (start_ind + i,), 
-            electrode = electrodes[i]
-        )
-        
-        # Keep track of the electrodes
-        if electrodes[i]:
-            NWN.graph["electrode_list"].append((start_ind + i,))
 
-        # Find intersects
-        intersect_dict = find_line_intersects(start_ind + i, NWN.graph["lines"])
-        
-        # Add edges to NWN
-        conductance = 1 / resistance if resistance is not None else NWN.graph["junction_conductance"]
-        NWN.add_edges_from(
-            [((key[0],), (key[1],)) for key in intersect_dict.keys()], 
-            conductance = conductance,
-            capacitance = NWN.graph["junction_capacitance"],
-            w = 0.0,
-            tau = 0.0,
-            epsilon = 0.0,
-            type = "junction"
-        )
-        NWN.graph["loc"].update(intersect_dict)
+        # Rebuild the tree once enough wires are outside of it
+        wire_num = start_ind + i + 1
+        if (wire_num - len(tree.geometries))**2 >= wire_num:
+            tree = STRtree(NWN.graph["lines"])
 
-        # Update index lookup
-        NWN.graph["node_indices"].update({(start_ind + i,): start_ind + i})
+        intersect_dict.update(find_line_intersects(
+            start_ind + i, NWN.graph["lines"], tree))
+
+    NWN.graph["_strtree"] = tree
+
+    # Add the new wires as nodes and keep track of the electrodes
+    NWN.add_nodes_from(new_wire_nodes)
+    NWN.graph["electrode_list"].extend(
+        node for node, electrode in zip(new_wire_nodes, electrodes) if electrode)
+
+    # Add edges to NWN
+    conductance = 1 / resistance if resistance is not None else NWN.graph["junction_conductance"]
+    NWN.add_edges_from(
+        [((key[0],), (key[1],)) for key in intersect_dict.keys()], 
+        conductance = conductance,
+        capacitance = NWN.graph["junction_capacitance"],
+        w = 0.0,
+        tau = 0.0,
+        epsilon = 0.0,
+        type = "junction"
+    )
+
+    # Add the new wire geometry and intersection locations
+    _set_geometry_arrays(NWN, get_endpoints(lines), intersect_dict)
+
+    # Update index lookup
+    NWN.graph["node_indices"].update({node: node[0] for node in new_wire_nodes})
 
     # Update wire density
     NWN.graph["wire_density"] = (NWN.graph["wire_num"] - len(NWN.graph["electrode_list"])) / NWN.graph["size"]
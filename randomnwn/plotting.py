@@ -15,6 +15,7 @@ import matplotlib as mpl
 from typing import Tuple
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
 from itertools import zip_longest
 
 def plot_NWN(
@@ -70,30 +71,27 @@ def plot_NWN(
     """
     fig, ax = plt.subplots(figsize=(8, 6))
     l0 = NWN.graph["units"]["l0"]
+    segments = NWN.graph["endpoints"].reshape(-1, 2, 2)
 
     # Plot intersection plots if required
     if intersections:
-        ax.scatter(
-            *np.array([(point.x, point.y) for point in NWN.graph["loc"].values()]).T, 
-            zorder=10, s=5, c="blue"
-        )
+        loc_xy = NWN.graph["loc_xy"]
+        ax.scatter(loc_xy[:, 0], loc_xy[:, 1], zorder=10, s=5, c="blue")
 
     # Defaults to blue and pink lines, else random colors are used.
     if color is not None:
         c_map = mpl.cm.get_cmap('plasma').copy()
         norm = mpl.colors.Normalize(vmin=np.nanmin(color), vmax=max(np.nanmax(color), 0.1))
-        color = c_map(norm(color))
-        for i in range(NWN.graph["wire_num"]):
-            ax.plot(*np.array(NWN.graph["lines"][i]).T, c=color[i])
+        lines = LineCollection(segments, array=color, cmap=c_map, norm=norm)
     elif rnd_color:
-        for i in range(NWN.graph["wire_num"]):
-            ax.plot(*np.array(NWN.graph["lines"][i]).T)
+        lines = LineCollection(
+            segments, colors=plt.rcParams["axes.prop_cycle"].by_key()["color"])
     else:
-        for i in range(NWN.graph["wire_num"]):
-            if (i,) in NWN.graph["electrode_list"]:
-                ax.plot(*np.array(NWN.graph["lines"][i]).T, c="xkcd:light blue")
-            else:
-                ax.plot(*np.array(NWN.graph["lines"][i]).T, c="pink")
+        colors = np.where(NWN.graph["electrode"], "xkcd:light blue", "pink")
+        lines = LineCollection(segments, colors=colors)
+
+    ax.add_collection(lines)
+    ax.autoscale_view()
 
     # Scale axes according to the characteristic values
     if scaled:
@@ -176,8 +174,8 @@ def draw_NWN(
 
         # Nodes are placed at the center of the wire
         kwargs.update({
-            "pos": {(i,): np.array(NWN.graph["lines"][i].centroid) 
-                for i in range(NWN.graph["wire_num"])}
+            "pos": {(i,): midpoint 
+                for i, midpoint in enumerate(NWN.graph["midpoints"])}
         })
 
         # Label node voltages if sol is given, else just label as nodes numbers
@@ -243,46 +241,42 @@ def plot_NWN_sections(
     
     fig, ax = plt.subplots(figsize=(8, 6))
     l0 = NWN.graph["units"]["l0"]
+    segments = NWN.graph["endpoints"].reshape(-1, 2, 2)
     
     # Intersections
-    ax.scatter(
-        *np.array([(point.x, point.y) for point in NWN.graph["loc"].values()]).T, 
-        zorder=10, s=5, c="blue"
-    )
+    loc_xy = NWN.graph["loc_xy"]
+    ax.scatter(loc_xy[:, 0], loc_xy[:, 1], zorder=10, s=5, c="blue")
     
     # Lines
-    for i in range(NWN.graph["wire_num"]):
-        if (i,) in NWN.graph["electrode_list"]:
-            ax.plot(*np.array(NWN.graph["lines"][i]).T, c="xkcd:light blue")
-        else:
-            ax.plot(*np.array(NWN.graph["lines"][i]).T, c="pink", alpha=0.6)
+    colors = np.where(
+        NWN.graph["electrode"][:, None], 
+        mpl.colors.to_rgba("xkcd:light blue"), 
+        mpl.colors.to_rgba("pink", 0.6)
+    )
+    ax.add_collection(LineCollection(segments, colors=colors))
+    ax.autoscale_view()
     
-    min_current, max_current = np.inf, -np.inf
-    for l_c in section_current:
-        for c in l_c:
-            if c < min_current: min_current = c
-            if c > max_current: max_current = c
+    all_current = np.concatenate(
+        [np.empty(0), *(np.asarray(l_c, dtype=float) for l_c in section_current)])
+    min_current = float(all_current.min(initial=np.inf))
+    max_current = float(all_current.max(initial=-np.inf))
     
     c_map = mpl.cm.get_cmap('YlOrRd').copy()
     norm = mpl.colors.Normalize(vmin=min_current, vmax=max(max_current, min_current+1e-10))
             
     # Section currents on top
-    for i in range(NWN.graph["wire_num"]):
-        if (i,) in NWN.graph["electrode_list"]: continue
-
-        point_coords = []
-        for intersected_line in NWN.graph['section_point'][i]:
-            intersect_point = NWN.graph['loc'].get((i, intersected_line), None) or NWN.graph['loc'].get((intersected_line, i), None)
-            point_coords.append(intersect_point.coords[0])
-        
-        for s in range(len(section_current[i])):
-            ax.plot(
-                [point_coords[s][0], point_coords[s+1][0]],
-                [point_coords[s][1], point_coords[s+1][1]],
-                c=c_map(norm(section_current[i][s])),
-            )
-        
-        
+    section_segments, section_values = [np.empty((0, 2, 2))], [np.empty(0)]
+    for i in np.flatnonzero(~NWN.graph["electrode"]):
+        points = NWN.graph['section_coords'][i]
+        section_segments.append(np.stack([points[:-1], points[1:]], axis=1))
+        section_values.append(np.asarray(section_current[i], dtype=float))
+
+    ax.add_collection(LineCollection(
+        np.concatenate(section_segments), 
+        array = np.concatenate(section_values), 
+        cmap = c_map, 
+        norm = norm
+    ))
     
     # Scale axes according to the characteristic values
     if scaled:
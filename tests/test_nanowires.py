@@ -3,8 +3,11 @@ from pathlib import Path
 
 from randomnwn import *
 from randomnwn.fromtext import *
+from randomnwn.line_functions import _find_intersects_tiled
 from networkx import single_source_dijkstra
 from numpy import hypot
+from numpy.random import default_rng
+from shapely.geometry import LineString
 
 
 @pytest.fixture
@@ -71,4 +74,96 @@ def test_benchmark_network_MNR():
 
     R_MNR = 20 + Rin1 + 20 + Rin2 + \
         1 / (1 / (Rin3 + 20) + 1 / (20 + Rin4 + 20))    # ~74.618
-    assert abs(R - R_MNR) < 1e-8
\ No newline at end of file
+    assert abs(R - R_MNR) < 1e-8
+
+
+def test_wire_arrays(NWN):
+    add_electrodes(NWN, "left", "right")
+    wire_num = NWN.graph["wire_num"]
+
+    assert NWN.graph["endpoints"].shape == (wire_num, 4)
+    assert NWN.graph["midpoints"].shape == (wire_num, 2)
+    assert NWN.graph["electrode"].tolist() == [
+        (i,) in NWN.graph["electrode_list"] for i in range(wire_num)]
+
+    for key, point in NWN.graph["loc"].items():
+        assert tuple(NWN.graph["loc_xy"][NWN.graph["loc_idx"][key]]) == (point.x, point.y)
+
+
+def test_create_lines_bulk():
+    rng = default_rng(123)
+    lines = [create_line(2.0, xmax=5, ymax=3, rng=rng) for _ in range(10)]
+    endpoints = create_lines_bulk(10, 2.0, xmax=5, ymax=3, rng=default_rng(123))
+
+    assert np.allclose(endpoints, get_endpoints(lines))
+
+
+def test_find_intersects_sweep():
+    endpoints = create_lines_bulk(50, 0.5, rng=default_rng(123))
+    idx_a, idx_b = np.triu_indices(50, k=1)
+    mask, points = segment_intersects(endpoints, idx_a, idx_b)
+
+    sweep_a, sweep_b, sweep_points = _find_intersects_tiled(endpoints)
+    assert sweep_a.tolist() == idx_a[mask].tolist()
+    assert sweep_b.tolist() == idx_b[mask].tolist()
+    assert np.allclose(sweep_points, points)
+
+
+def test_benchmark_network_currents():
+    # Get benchmark file
+    current_path = Path(__file__).parent.resolve()
+    benchmark = current_path.joinpath("test_networks/benchmark.txt")
+
+    # Create JDA nanowire network
+    units = {"Ron": 20.0, "rho0": 22.63676, "D0": 60.0, "l0": 1.0}
+    NWN = create_NWN_from_txt(str(benchmark), units=units)
+
+    # 3/8 flows through wires 4 and 2, then splits 1/4 directly into the 
+    # drain and 1/8 through wire 5. Wire 3 is not connected.
+    for V in [1.0, -1.0]:
+        I_drain = solve_drain_current(NWN, (0,), (1,), V)
+        assert abs(I_drain - V * 3/8) < 1e-8
+
+        I_nodal = solve_nodal_current(NWN, (0,), (1,), V)
+        if V > 0:
+            ans = [0, 3/8, 3/8, 0, 3/8, 1/8]
+        else:
+            ans = [-3/8, 0, -3/8, 0, -3/8, -1/8]
+        assert np.allclose(I_nodal, ans)
+
+
+def test_add_wires(NWN):
+    rng = default_rng(123)
+    length, width = NWN.graph["length"], NWN.graph["width"]
+    wire_num = NWN.graph["wire_num"]
+
+    # Enough wires per call for the spatial index to be rebuilt in each call
+    for _ in range(3):
+        lines = [create_line(1.0, xmax=length, ymax=width, rng=rng) for _ in range(40)]
+        add_wires(NWN, lines, [False] * len(lines))
+
+    assert wire_num < len(NWN.graph["_strtree"].geometries) <= NWN.graph["wire_num"]
+
+    intersects = find_intersects(NWN.graph["lines"])
+    assert set(NWN.graph["loc"].keys()) == set(intersects.keys())
+    assert set(tuple(sorted(edge)) for edge in NWN.edges) == set(
+        ((i,), (j,)) for i, j in intersects.keys())
+
+
+def test_find_intersects_shapely():
+    # Line counts on either side of the STRtree cutoff
+    for num in [100, 300]:
+        endpoints = create_lines_bulk(num, 1.0, xmax=5, ymax=5, rng=default_rng(123))
+        lines = [LineString(line.reshape(2, 2)) for line in endpoints]
+
+        # Check every pair with Shapely
+        ans = {}
+        for i in range(num):
+            for j in range(i + 1, num):
+                if lines[i].intersects(lines[j]):
+                    ans[(i, j)] = lines[i].intersection(lines[j])
+
+        intersects = find_intersects(lines)
+        assert list(intersects.keys()) == list(ans.keys())
+        for key, point in intersects.items():
+            assert point.distance(ans[key]) < 1e-9